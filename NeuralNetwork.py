@@ -1,11 +1,92 @@
 import random
-from TinyGrad import Value
+
+import numpy as np
+
+from TinyGrad import Value, Tensor
+
+
+def _mlp_forward_loops(x, weights, biases):
+    """
+    Loop-based forward pass of an MLP: ReLU(x @ W.T + b) for every layer except the last one.
+    Written for Numba, which compiles it to a native kernel (see _compiled_mlp_forward).
+
+    Args:
+        x: Batch of input vectors (2-D float64 array)
+        weights: Weight matrices of all layers
+        biases: Bias vectors of all layers
+
+    Returns:
+        Batch of output vectors of the last layer
+    """
+
+    n_layers = len(weights)
+    for i in range(n_layers):
+        W = weights[i]
+        b = biases[i]
+        out = np.empty((x.shape[0], W.shape[0]))
+        for n in range(x.shape[0]):
+            for j in range(W.shape[0]):
+                acc = b[j]
+                for k in range(W.shape[1]):
+                    acc += W[j, k] * x[n, k]
+                out[n, j] = acc if i == n_layers - 1 or acc > 0.0 else 0.0
+        x = out
+
+    return x
+
+
+def _mlp_forward_numpy(x, weights, biases):
+    """
+    NumPy forward pass of an MLP: ReLU(x @ W.T + b) for every layer except the last one.
+
+    Args:
+        x: Batch of input vectors (2-D float64 array)
+        weights: Weight matrices of all layers
+        biases: Bias vectors of all layers
+
+    Returns:
+        Batch of output vectors of the last layer
+    """
+
+    n_layers = len(weights)
+    for i in range(n_layers):
+        x = x @ weights[i].T + biases[i]
+        if i < n_layers - 1:
+            x = np.maximum(x, 0.0)
+
+    return x
+
+
+# Numba kernel for compile_inference: None until first use, False if Numba is not installed
+_mlp_forward_kernel = None
+
+
+def _compiled_mlp_forward():
+    """
+    Import Numba and compile the inference kernel on first use,
+    so that importing this module does not pay for loading Numba.
+
+    Returns:
+        Compiled kernel, or None if Numba is not installed
+    """
+
+    global _mlp_forward_kernel
+    if _mlp_forward_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # Numba is optional, compiled inference then falls back to NumPy
+            _mlp_forward_kernel = False
+        else:
+            _mlp_forward_kernel = njit(cache=True, fastmath=True)(_mlp_forward_loops)
+
+    return _mlp_forward_kernel or None
 
 
 class Module:
     """
     Base class for all neural network modules.
     Provides common functionality for parameter management.
+    The built-in modules build their flat parameter list once, in _params, at construction time.
     """
 
     def zero_grad(self):
@@ -15,7 +96,7 @@ class Module:
         """
 
         for p in self.parameters():
-            p.grad = 0
+            p.zero_grad()
 
     def parameters(self):
         """
@@ -43,6 +124,7 @@ class Neuron(Module):
         self.weights = [Value(random.uniform(-1, 1)) for _ in range(input_size)]
         self.bias = Value(0)
         self.nonlin = nonlin
+        self._params = self.weights + [self.bias]
 
     def __call__(self, x):
         """
@@ -55,14 +137,14 @@ class Neuron(Module):
             Activation value after applying weights, bias, and non-linearity
         """
 
-        activation = sum((w * xi for w, xi in zip(self.weights, x)), self.bias)
+        activation = Value.affine(self.weights, x, self.bias)
 
         return activation.relu() if self.nonlin else activation
 
     def parameters(self):
         """Return all trainable parameters (weights + bias)"""
 
-        return self.weights + [self.bias]
+        return self._params
 
     def __repr__(self):
         """String representation showing neuron type and input size"""
@@ -74,44 +156,67 @@ class Neuron(Module):
 
 class Layer(Module):
     """
-    A layer of multiple neurons operating in parallel.
+    A fully connected layer of neurons operating in parallel.
+    Weights are stored as a single matrix so the whole layer runs as one matrix product.
     """
 
-    def __init__(self, input_size, output_size, **kwargs):
+    def __init__(self, input_size, output_size, nonlin=True):
         """
         Create a fully connected layer.
 
         Args:
             input_size: Number of input features
             output_size: Number of neurons in the layer
-            **kwargs: Additional arguments passed to Neuron constructor
+            nonlin: Whether to apply ReLU activation (default: True)
         """
 
-        self.neurons = [Neuron(input_size, **kwargs) for _ in range(output_size)]
+        self.W = Tensor(np.random.uniform(-1, 1, (output_size, input_size)))
+        self.b = Tensor(np.zeros(output_size))
+        self.nonlin = nonlin
+        self._params = [self.W, self.b]
 
     def __call__(self, x):
         """
         Compute layer output for given input.
 
         Args:
-            x: Input values (list of numbers)
+            x: Input values (Tensor or array-like of shape (input_size,)
+               or a batch of shape (batch_size, input_size))
 
         Returns:
-            Single value if output_size=1, else list of neuron outputs
+            Tensor of shape (output_size,) or (batch_size, output_size) with the neuron outputs
         """
 
-        outputs = [neuron(x) for neuron in self.neurons]
-        return outputs[0] if len(outputs) == 1 else outputs
+        return self.forward_fused(x)
+
+    def forward_fused(self, x):
+        """
+        Compute layer output as a single fused node of the computational graph.
+
+        Args:
+            x: Input values (Tensor or array-like of shape (input_size,)
+               or a batch of shape (batch_size, input_size))
+
+        Returns:
+            Tensor holding ReLU(x @ W.T + b), or x @ W.T + b for a linear layer
+        """
+
+        x = x if isinstance(x, Tensor) else Tensor(x)
+
+        return x.linear(self.W, self.b, relu=self.nonlin)
 
     def parameters(self):
-        """Return all parameters from all neurons in the layer"""
+        """Return all parameters of the layer (weight matrix + bias vector)"""
 
-        return [param for neuron in self.neurons for param in neuron.parameters()]
+        return self._params
 
     def __repr__(self):
-        """Show layer configuration with all neurons"""
+        """Show layer configuration"""
 
-        return f"Layer([{', '.join(str(neuron) for neuron in self.neurons)}])"
+        activation = "ReLU" if self.nonlin else "Linear"
+        output_size, input_size = self.W.data.shape
+
+        return f"{activation}Layer(input_size={input_size}, output_size={output_size})"
 
 
 class MLP(Module):
@@ -134,27 +239,97 @@ class MLP(Module):
             # Create layers with ReLU except for last layer
             layer = Layer(sizes[i], sizes[i + 1], nonlin=(i != len(layer_sizes) - 1))
             self.layers.append(layer)
+        self._params = [param for layer in self.layers for param in layer._params]
+
+        # Move all parameters and their gradients into two contiguous buffers;
+        # every Tensor keeps a view into them, so updates must be done in place
+        size = sum(p.data.size for p in self._params)
+        self._flat_data = np.empty(size)
+        self._flat_grad = np.zeros(size)
+        offset = 0
+        for p in self._params:
+            shape = p.data.shape
+            self._flat_data[offset:offset + p.data.size] = p.data.ravel()
+            p.data = self._flat_data[offset:offset + p.data.size].reshape(shape)
+            p.grad = self._flat_grad[offset:offset + p.data.size].reshape(shape)
+            offset += p.data.size
 
     def __call__(self, x):
         """
         Perform forward pass through the network.
 
         Args:
-            x: Input values (list of numbers)
+            x: Input values (Tensor or array-like of shape (input_size,)
+               or a batch of shape (batch_size, input_size))
 
         Returns:
-            Output of the last layer
+            Output Tensor of the last layer, with the same leading batch axis as x
         """
 
+        x = x if isinstance(x, Tensor) else Tensor(x)
         for layer in self.layers:
             x = layer(x)
 
         return x
 
+    def zero_grad(self):
+        """
+        Resets gradients of all parameters to zero with a single fill of the gradient buffer.
+        """
+
+        self._flat_grad.fill(0.0)
+
+    def step(self, lr):
+        """
+        Gradient descent update of all parameters as one vectorized operation.
+
+        Args:
+            lr: Learning rate
+        """
+
+        self._flat_data -= lr * self._flat_grad
+
+    def compile_inference(self):
+        """
+        Pack the network weights for a forward pass that bypasses the autograd graph.
+        With Numba installed the pass runs as a native kernel; the compiled specialization
+        depends only on array types, so it is shared by every architecture.
+        Weights are referenced rather than copied, so in-place parameter updates stay visible.
+
+        Returns:
+            Function mapping an input vector, or a batch of them, to the outputs (NumPy arrays)
+        """
+
+        weights = [layer.W.data for layer in self.layers]
+        biases = [layer.b.data for layer in self.layers]
+        forward = _compiled_mlp_forward()
+        if forward is not None:
+            from numba.typed import List
+
+            weights, biases = List(weights), List(biases)
+        else:
+            forward = _mlp_forward_numpy
+            weights, biases = tuple(weights), tuple(biases)
+
+        input_size = weights[0].shape[1]
+
+        def predict(x):
+            x = np.asarray(x, dtype=np.float64)
+            # The Numba kernel does no bounds checking, so validate the shape up front
+            if x.ndim not in (1, 2) or x.shape[-1] != input_size:
+                raise ValueError(
+                    f"Expected input of shape ({input_size},) or (batch_size, {input_size}), got {x.shape}"
+                )
+            if x.ndim == 1:
+                return forward(x[np.newaxis], weights, biases)[0]
+            return forward(x, weights, biases)
+
+        return predict
+
     def parameters(self):
         """Return all trainable parameters in the network"""
 
-        return [param for layer in self.layers for param in layer.parameters()]
+        return self._params
 
     def __repr__(self):
         """Show network architecture with all layers"""
@@ -1,4 +1,6 @@
-from TinyGrad import Value
+import numpy as np
+
+from TinyGrad import Tensor, no_grad
 from NeuralNetwork import MLP
 
 # Create a 2-layer MLP with 3 inputs → 4 → 1 output
@@ -6,7 +8,7 @@ model = MLP(3, [4, 1])
 print(model)
 
 # Forward pass
-x = [Value(1.0), Value(2.0), Value(3.0)]
+x = Tensor([1.0, 2.0, 3.0])
 output = model(x)
 print("Output:", output)
 
@@ -19,9 +21,8 @@ output.backward()
 # After backward pass
 print(model.parameters())
 
-# Update parameters (simplified example)
-for p in model.parameters():
-    p.data -= 0.01 * p.grad
+# Update parameters (one vectorized step over all weights and biases)
+model.step(0.01)
 
 # Updated parameters
 print(model.parameters())
@@ -30,3 +31,18 @@ print(model.parameters())
 # After zero_grad
 model.zero_grad()
 print(model.parameters())
+
+
+# Batch training: the whole batch goes through the network in one call
+X = Tensor(np.random.uniform(-1, 1, (32, 3)))
+Y = X.data.sum(axis=1, keepdims=True)  # Target: sum of the inputs
+for step in range(100):
+    loss = ((model(X) - Y) ** 2).mean()
+    model.zero_grad()
+    loss.backward()
+    model.step(0.05)
+print("Batch loss:", loss.data)
+
+# Inference without building the computational graph
+with no_grad():
+    print("Prediction:", model(Tensor([0.5, -0.2, 0.1])).data)
@@ -1,5 +1,12 @@
+import math
 import unittest
-from TinyGrad import Value
+from unittest import mock
+
+import numpy as np
+
+import NeuralNetwork
+from NeuralNetwork import MLP, Module, Neuron
+from TinyGrad import Value, Tensor, no_grad
 
 
 class TestValue(unittest.TestCase):
@@ -30,6 +37,13 @@ class TestValue(unittest.TestCase):
         self.assertAlmostEqual(a.grad, 0.5, places=4)
         self.assertAlmostEqual(b.grad, -1.5, places=4)
 
+    def test_div_by_number(self):
+        a = Value(6.0)
+        c = a / 2
+        c.backward()
+        self.assertAlmostEqual(c.data, 3.0, places=4)
+        self.assertAlmostEqual(a.grad, 0.5, places=4)
+
     def test_relu(self):
         a = Value(-2.0)
         b = a.relu()
@@ -50,6 +64,20 @@ class TestValue(unittest.TestCase):
         self.assertAlmostEqual(b.data, 0.5, places=4)
         self.assertAlmostEqual(a.grad, 0.25, places=4)
 
+    def test_tanh(self):
+        a = Value(0.5)
+        b = a.tanh()
+        b.backward()
+        self.assertAlmostEqual(b.data, math.tanh(0.5), places=4)
+        self.assertAlmostEqual(a.grad, 1 - math.tanh(0.5) ** 2, places=4)
+
+    def test_elu(self):
+        a = Value(-1.0)
+        b = a.elu(alpha=2.0)
+        b.backward()
+        self.assertAlmostEqual(b.data, 2.0 * (math.exp(-1.0) - 1), places=4)
+        self.assertAlmostEqual(a.grad, 2.0 * math.exp(-1.0), places=4)
+
     def test_pow(self):
         a = Value(2.0)
         b = a ** 3
@@ -57,6 +85,15 @@ class TestValue(unittest.TestCase):
         self.assertAlmostEqual(b.data, 8.0, places=4)
         self.assertAlmostEqual(a.grad, 12.0, places=4)  # 3*(2)^2 = 12
 
+    def test_pow_value_exponent(self):
+        a = Value(2.0)
+        b = Value(3.0)
+        c = a ** b
+        c.backward()
+        self.assertAlmostEqual(c.data, 8.0, places=4)
+        self.assertAlmostEqual(a.grad, 12.0, places=4)
+        self.assertAlmostEqual(b.grad, 8.0 * math.log(2.0), places=4)  # 2^3 * ln(2)
+
     def test_chain_rule(self):
         a = Value(2.0)
         b = a ** 2 + 1
@@ -66,6 +103,270 @@ class TestValue(unittest.TestCase):
         self.assertAlmostEqual(d.data, 15.0, places=4)  # (2²+1)*3=15
         self.assertAlmostEqual(a.grad, 12.0, places=4)   # 3*(2*2) = 12
 
+    def test_affine(self):
+        w1 = Value(2.0)
+        w2 = Value(-1.0)
+        b = Value(0.5)
+        x = Value(3.0)
+        y = Value.affine([w1, w2], [x, 4.0], b)
+        y.backward()
+        self.assertAlmostEqual(y.data, 2.5, places=4)  # 0.5 + 2*3 - 1*4
+        self.assertAlmostEqual(w1.grad, 3.0, places=4)
+        self.assertAlmostEqual(w2.grad, 4.0, places=4)
+        self.assertAlmostEqual(b.grad, 1.0, places=4)
+        self.assertAlmostEqual(x.grad, 2.0, places=4)
+
+    def test_deep_graph(self):
+        a = Value(1.0)
+        b = a
+        for _ in range(5000):  # deeper than the default recursion limit
+            b = b + 1
+        b.backward()
+        self.assertAlmostEqual(b.data, 5001.0, places=4)
+        self.assertAlmostEqual(a.grad, 1.0, places=4)
+
+    def test_backward_canonicalize(self):
+        a = Value(2.0)
+        b = Value(3.0)
+        c = a * b
+        d = b * a  # same subexpression as c
+        e = c + d
+        e.backward(canonicalize=True)
+        self.assertAlmostEqual(e.data, 12.0, places=4)
+        self.assertAlmostEqual(a.grad, 6.0, places=4)
+        self.assertAlmostEqual(b.grad, 4.0, places=4)
+        self.assertIs(e._prev[0], e._prev[1])  # both operands now point to one node
+
+    def test_backward_skips_detached_branch(self):
+        w = Value(4.0)
+        x = Value(3.0, requires_grad=False)
+        y = x * x  # does not depend on any value that requires a gradient
+        z = w * 2 + y
+        z.backward()
+        self.assertAlmostEqual(z.data, 17.0, places=4)
+        self.assertAlmostEqual(w.grad, 2.0, places=4)
+        self.assertAlmostEqual(x.grad, 0.0, places=4)
+
+    def test_compile_backward(self):
+        a = Value(2.0)
+        b = Value(3.0)
+        c = ((a * b + a) ** 2).tanh() + (a / b).sigmoid() * b.relu().exp()
+        steps = c.compile_backward()
+        for _ in range(3):
+            for step in steps:
+                step()
+
+            # Same expression built from scratch on the current leaf values
+            a2 = Value(a.data)
+            b2 = Value(b.data)
+            c2 = ((a2 * b2 + a2) ** 2).tanh() + (a2 / b2).sigmoid() * b2.relu().exp()
+            c2.backward()
+            self.assertAlmostEqual(c.data, c2.data, places=6)
+            self.assertAlmostEqual(a.grad, a2.grad, places=6)
+            self.assertAlmostEqual(b.grad, b2.grad, places=6)
+
+            # Gradient descent step on the leaves, in place
+            for p in (a, b):
+                p.data -= 0.1 * p.grad
+                p.zero_grad()
+
+    def test_no_grad(self):
+        a = Value(2.0)
+        with no_grad():
+            b = a * 3 + 1
+        self.assertAlmostEqual(b.data, 7.0, places=4)
+        self.assertEqual(b._prev, ())
+        self.assertFalse(b.requires_grad)
+        b.backward()
+        self.assertAlmostEqual(a.grad, 0.0, places=4)
+
+        c = a * 3  # graph construction is enabled again after the block
+        c.backward()
+        self.assertAlmostEqual(a.grad, 3.0, places=4)
+
+
+class TestTensor(unittest.TestCase):
+    def test_add_broadcast(self):
+        a = Tensor([[1.0, 2.0], [3.0, 4.0]])
+        b = Tensor([10.0, 20.0])
+        c = a + b
+        c.backward()
+        np.testing.assert_allclose(c.data, [[11.0, 22.0], [13.0, 24.0]])
+        np.testing.assert_allclose(a.grad, np.ones((2, 2)))
+        np.testing.assert_allclose(b.grad, [2.0, 2.0])
+
+    def test_matmul(self):
+        x = Tensor([1.0, 2.0])
+        W = Tensor([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+        y = x @ W.T
+        y.backward()
+        np.testing.assert_allclose(y.data, [5.0, 11.0, 17.0])
+        np.testing.assert_allclose(x.grad, [9.0, 12.0])
+        np.testing.assert_allclose(W.grad, [[1.0, 2.0], [1.0, 2.0], [1.0, 2.0]])
+
+    def test_matmul_vector_right(self):
+        W = Tensor([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+        x = Tensor([1.0, -1.0])
+        y = W @ x
+        y.backward()
+        np.testing.assert_allclose(y.data, [-1.0, -1.0, -1.0])
+        np.testing.assert_allclose(W.grad, [[1.0, -1.0], [1.0, -1.0], [1.0, -1.0]])
+        np.testing.assert_allclose(x.grad, [9.0, 12.0])
+
+    def test_matmul_dot(self):
+        a = Tensor([1.0, 2.0, 3.0])
+        b = Tensor([4.0, 5.0, 6.0])
+        c = a @ b
+        c.backward()
+        self.assertAlmostEqual(float(c.data), 32.0, places=4)
+        np.testing.assert_allclose(a.grad, [4.0, 5.0, 6.0])
+        np.testing.assert_allclose(b.grad, [1.0, 2.0, 3.0])
+
+    def test_matmul_rejects_3d(self):
+        with self.assertRaises(ValueError):
+            Tensor(np.ones((2, 2, 2))) @ Tensor(np.ones((2, 2)))
+
+    def test_matmul_batch(self):
+        X = Tensor([[1.0, 2.0], [3.0, 4.0]])
+        W = Tensor([[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]])
+        Y = X @ W.T
+        Y.backward()
+        np.testing.assert_allclose(Y.data, [[1.0, 4.0, 3.0], [3.0, 8.0, 7.0]])
+        np.testing.assert_allclose(X.grad, [[2.0, 3.0], [2.0, 3.0]])
+        np.testing.assert_allclose(W.grad, [[4.0, 6.0], [4.0, 6.0], [4.0, 6.0]])
+
+    def test_linear_matches_unfused(self):
+        X = np.array([[1.0, -2.0], [0.5, 3.0]])
+        W = np.array([[1.0, 0.5], [-1.0, 2.0], [0.3, -0.7]])
+        b = np.array([0.1, -0.2, 0.3])
+        x1, W1, b1 = Tensor(X), Tensor(W), Tensor(b)
+        y1 = (x1 @ W1.T + b1).relu()
+        (y1 ** 2).sum().backward()
+        x2, W2, b2 = Tensor(X), Tensor(W), Tensor(b)
+        y2 = x2.linear(W2, b2, relu=True)
+        (y2 ** 2).sum().backward()
+        np.testing.assert_allclose(y2.data, y1.data)
+        np.testing.assert_allclose(x2.grad, x1.grad)
+        np.testing.assert_allclose(W2.grad, W1.grad)
+        np.testing.assert_allclose(b2.grad, b1.grad)
+
+    def test_relu(self):
+        a = Tensor([-2.0, 3.0])
+        b = a.relu()
+        b.backward()
+        np.testing.assert_allclose(b.data, [0.0, 3.0])
+        np.testing.assert_allclose(a.grad, [0.0, 1.0])
+
+    def test_mean(self):
+        a = Tensor([[1.0, 2.0], [3.0, 6.0]])
+        b = (a ** 2).mean()
+        b.backward()
+        self.assertAlmostEqual(float(b.data), 12.5, places=4)
+        np.testing.assert_allclose(a.grad, [[0.5, 1.0], [1.5, 3.0]])
+
+    def test_no_grad_skips_gradient_buffers(self):
+        W = Tensor([[1.0, -1.0], [2.0, 0.5]])
+        b = Tensor([0.0, -1.0])
+        with no_grad():
+            y = Tensor([1.0, 2.0]).linear(W, b, relu=True)
+            z = y @ W.T
+        np.testing.assert_allclose(y.data, [0.0, 2.0])
+        self.assertIsNone(y._grad)
+        self.assertIsNone(z._grad)
+        self.assertIsNone(W._grad)
+
+        # A no_grad result can still be used as a leaf of a later graph
+        (y * 2).sum().backward()
+        np.testing.assert_allclose(y.grad, [2.0, 2.0])
+
+
+class TestMLP(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)  # MLP weights are random; keep every run identical
+
+    def check_compile_inference(self):
+        model = MLP(3, [4, 2])
+        X = np.array([[1.0, 2.0, 3.0], [-1.0, 0.5, 0.0]])
+        predict = model.compile_inference()
+        with no_grad():
+            np.testing.assert_allclose(predict(X[0]), model(X[0]).data)
+            np.testing.assert_allclose(predict(X), model(X).data)
+
+        # The packed weights are references, so an update must be visible to predict
+        before = predict(X)
+        model(X).sum().backward()
+        model.step(0.1)
+        with no_grad():
+            np.testing.assert_allclose(predict(X), model(X).data)
+        self.assertFalse(np.allclose(predict(X), before))
+
+        for bad in ([1.0, 2.0], [1.0, 2.0, 3.0, 4.0], np.ones((2, 4)), np.ones((1, 1, 3))):
+            with self.assertRaises(ValueError):
+                predict(bad)
+
+    def test_compile_inference(self):
+        self.check_compile_inference()
+
+    def test_compile_inference_without_numba(self):
+        with mock.patch.object(NeuralNetwork, '_mlp_forward_kernel', False):
+            self.check_compile_inference()
+
+    def test_zero_grad_custom_module(self):
+        class Pair(Module):
+            def __init__(self):
+                self.a = Neuron(2, nonlin=False)
+                self.b = Neuron(2, nonlin=False)
+
+            def parameters(self):
+                return self.a.parameters() + self.b.parameters()
+
+        model = Pair()
+        (model.a([1.0, 2.0]) + model.b([1.0, 2.0])).backward()
+        self.assertTrue(any(p.grad != 0 for p in model.parameters()))
+        model.zero_grad()
+        for p in model.parameters():
+            self.assertEqual(p.grad, 0.0)
+
+    def test_batch_forward_backward(self):
+        model = MLP(3, [4, 2])
+        X = Tensor(np.random.uniform(-1, 1, (5, 3)))
+        out = model(X)
+        self.assertEqual(out.shape, (5, 2))
+        np.testing.assert_allclose(out.data[1], model(X.data[1]).data)
+
+        (out ** 2).mean().backward()
+        self.assertEqual(X.grad.shape, (5, 3))
+        for p in model.parameters():
+            self.assertEqual(p.grad.shape, p.data.shape)
+
+    def test_forward_follows_layers(self):
+        model = MLP(3, [4, 2])
+        x = np.array([1.0, -2.0, 0.5])
+        model.layers[0].nonlin = False
+        expected = x @ model.layers[0].W.data.T + model.layers[0].b.data
+        expected = expected @ model.layers[1].W.data.T + model.layers[1].b.data
+        np.testing.assert_allclose(model(x).data, expected)
+
+    def test_flat_parameter_buffers(self):
+        model = MLP(3, [4, 2])
+        X = np.array([[1.0, 2.0, 3.0], [-1.0, 0.5, 0.0]])
+        (model(X) ** 2).mean().backward()
+        np.testing.assert_array_equal(
+            model._flat_grad, np.concatenate([p.grad.ravel() for p in model.parameters()])
+        )
+        self.assertTrue(np.any(model._flat_grad != 0))
+
+        W = model.layers[0].W
+        W_before = W.data.copy()
+        expected = W_before - 0.1 * W.grad
+        model.step(0.1)
+        np.testing.assert_allclose(W.data, expected)
+        self.assertFalse(np.allclose(W.data, W_before))
+
+        model.zero_grad()
+        for p in model.parameters():
+            np.testing.assert_array_equal(p.grad, np.zeros_like(p.data))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+# Compile-time declarations for TinyGrad.py, used only when it is built with Cython
+# (see setup.py). They turn Value into an extension type with C-level fields and give
+# the backward functions typed access to them; TinyGrad.py itself stays plain Python.
+
+cimport cython
+
+
+cdef class Value:
+    cdef public double data, grad
+    cdef public bint requires_grad
+    cdef public tuple _prev
+    cdef public str _op
+    cdef public object _c
+
+
+@cython.locals(a=Value, b=Value)
+cpdef _backward_add(Value out)
+
+@cython.locals(a=Value, b=Value)
+cpdef _backward_mul(Value out)
+
+@cython.locals(a=Value, b=Value)
+cpdef _backward_div(Value out)
+
+@cython.locals(a=Value)
+cpdef _backward_pow_const(Value out)
+
+@cython.locals(a=Value, b=Value)
+cpdef _backward_pow(Value out)
+
+@cython.locals(prev=tuple, i=Py_ssize_t, w=Value, x=Value)
+cpdef _backward_affine(Value out)
+
+@cython.locals(a=Value)
+cpdef _backward_relu(Value out)
+
+@cython.locals(a=Value)
+cpdef _backward_sigmoid(Value out)
+
+@cython.locals(a=Value)
+cpdef _backward_tanh(Value out)
+
+@cython.locals(a=Value)
+cpdef _backward_leaky_relu(Value out)
+
+@cython.locals(a=Value)
+cpdef _backward_elu(Value out)
+
+@cython.locals(a=Value)
+cpdef _backward_exp(Value out)
+
+
+@cython.locals(a=Value, b=Value)
+cpdef _forward_add(Value out)
+
+@cython.locals(a=Value, b=Value)
+cpdef _forward_mul(Value out)
+
+@cython.locals(a=Value, b=Value)
+cpdef _forward_div(Value out)
+
+@cython.locals(a=Value)
+cpdef _forward_pow_const(Value out)
+
+@cython.locals(a=Value, b=Value)
+cpdef _forward_pow(Value out)
+
+@cython.locals(prev=tuple, i=Py_ssize_t, data=double)
+cpdef _forward_affine(Value out)
+
+@cython.locals(a=Value)
+cpdef _forward_relu(Value out)
+
+@cython.locals(a=Value)
+cpdef _forward_sigmoid(Value out)
+
+@cython.locals(a=Value)
+cpdef _forward_tanh(Value out)
+
+@cython.locals(a=Value)
+cpdef _forward_leaky_relu(Value out)
+
+@cython.locals(a=Value)
+cpdef _forward_elu(Value out)
+
+@cython.locals(a=Value)
+cpdef _forward_exp(Value out)
@@ -1,4 +1,275 @@
 import math
+from functools import partial
+
+import numpy as np
+
+
+# Whether operations record the computational graph (see no_grad)
+_GRAD_ENABLED = True
+
+
+class no_grad:
+    """
+    Context manager that disables graph construction, e.g. for inference:
+
+        with no_grad():
+            output = model(x)
+
+    Operations inside the block return results with no parents and no backward step,
+    so no graph is kept alive and backward() through them does nothing.
+    """
+
+    def __enter__(self):
+        global _GRAD_ENABLED
+        self._was_enabled = _GRAD_ENABLED
+        _GRAD_ENABLED = False
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _GRAD_ENABLED
+        _GRAD_ENABLED = self._was_enabled
+
+
+# Operations whose result does not depend on the order of the operands
+_COMMUTATIVE = {'+', '*'}
+
+
+def build_topo(root, canonicalize=False):
+    """
+    Build the topological order of nodes in the computational graph.
+    Topological sorting ensures that parent nodes are processed before their children.
+    The graph is walked with an explicit stack, so deep graphs cannot hit the recursion limit.
+
+    With canonicalize=True (Value graphs only) common subexpressions are merged: a node with the
+    same operation, operands and constant as an earlier one is dropped from the order, and its
+    consumers are rewired to the earlier node, so its backward step runs only once.
+    The rewiring mutates _prev of the consumers; dropped duplicates keep a zero gradient.
+
+    :param root: final node of the graph (a Value or Tensor object).
+    :param canonicalize: whether to de-duplicate identical subexpressions.
+    :return: list of nodes, every node placed after all of its parents.
+    """
+
+    topo = []
+    visited = set()
+    canonical = {}  # id of a dropped duplicate -> node that replaces it
+    first_seen = {}  # (op, operand ids, constant) -> first node computing it
+    stack = [(root, False)]
+    while stack:
+        v, done = stack.pop()
+        if done:
+            # All parents of v are already in topo (and canonicalized)
+            if canonicalize and v._prev:
+                v._prev = tuple(canonical.get(id(child), child) for child in v._prev)
+                operands = tuple(id(child) for child in v._prev)
+                if v._op in _COMMUTATIVE:
+                    operands = tuple(sorted(operands))
+                key = (v._op, operands, v._c)
+                first = first_seen.setdefault(key, v)
+                if first is not v and first.data == v.data:
+                    canonical[id(v)] = first
+                    continue
+            topo.append(v)
+            continue
+        if v in visited:
+            continue
+        visited.add(v)
+        stack.append((v, True))
+        for child in v._prev:
+            stack.append((child, False))
+    return topo
+
+
+def _backward_leaf(out):
+    """Leaf nodes have no parents to propagate to."""
+
+
+def _backward_add(out):
+    a, b = out._prev
+    a.grad += out.grad
+    b.grad += out.grad
+
+
+def _backward_mul(out):
+    a, b = out._prev
+    a.grad += b.data * out.grad
+    b.grad += a.data * out.grad
+
+
+def _backward_div(out):
+    a, b = out._prev
+    a.grad += out.grad / b.data
+    b.grad -= out.grad * a.data / (b.data ** 2)
+
+
+def _backward_pow_const(out):
+    a, = out._prev
+    c = out._c
+    a.grad += (c * a.data ** (c - 1) if a.data != 0 else 0.0) * out.grad
+
+
+def _backward_pow(out):
+    a, b = out._prev
+    grad_a = b.data * (a.data ** (b.data - 1)) if a.data != 0 else 0.0
+    grad_b = (a.data ** b.data) * math.log(a.data) if a.data > 0 else 0.0
+
+    a.grad += grad_a * out.grad
+    b.grad += grad_b * out.grad
+
+
+def _backward_affine(out):
+    # _prev holds the bias followed by interleaved (weight, input) pairs
+    prev = out._prev
+    prev[0].grad += out.grad
+    for i in range(1, len(prev), 2):
+        w, x = prev[i], prev[i + 1]
+        w.grad += x.data * out.grad
+        x.grad += w.data * out.grad
+
+
+def _backward_relu(out):
+    a, = out._prev
+    a.grad += (out.data > 0) * out.grad
+
+
+def _backward_sigmoid(out):
+    a, = out._prev
+    a.grad += out.data * (1 - out.data) * out.grad
+
+
+def _backward_tanh(out):
+    a, = out._prev
+    a.grad += (1 - out.data ** 2) * out.grad
+
+
+def _backward_leaky_relu(out):
+    a, = out._prev
+    a.grad += (out._c if a.data < 0 else 1) * out.grad
+
+
+def _backward_elu(out):
+    a, = out._prev
+    # d/dx alpha * (e^x - 1) = alpha * e^x = out + alpha
+    a.grad += (out.data + out._c if a.data < 0 else 1) * out.grad
+
+
+def _backward_exp(out):
+    a, = out._prev
+    a.grad += out.data * out.grad
+
+
+# Backward function of every Value operation, keyed by the _op tag of the output node.
+# One shared function per operation replaces a closure per node.
+_BACKWARD = {
+    '': _backward_leaf,
+    '+': _backward_add,
+    '*': _backward_mul,
+    '/': _backward_div,
+    '**': _backward_pow_const,
+    'Pow': _backward_pow,
+    'Affine': _backward_affine,
+    'ReLU': _backward_relu,
+    'Sigmoid': _backward_sigmoid,
+    'Tanh': _backward_tanh,
+    'LeakyReLU': _backward_leaky_relu,
+    'ELU': _backward_elu,
+    'Exp': _backward_exp,
+}
+
+
+def _sigmoid(x):
+    """
+    Numerically stable logistic function.
+    :param x: number.
+    :return: 1 / (1 + e^-x), computed so that math.exp cannot overflow for large negative x.
+    """
+
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    e = math.exp(x)
+    return e / (1.0 + e)
+
+
+def _forward_add(out):
+    a, b = out._prev
+    out.data = a.data + b.data
+
+
+def _forward_mul(out):
+    a, b = out._prev
+    out.data = a.data * b.data
+
+
+def _forward_div(out):
+    a, b = out._prev
+    out.data = a.data / b.data
+
+
+def _forward_pow_const(out):
+    a, = out._prev
+    out.data = a.data ** out._c
+
+
+def _forward_pow(out):
+    a, b = out._prev
+    out.data = a.data ** b.data
+
+
+def _forward_affine(out):
+    # _prev holds the bias followed by interleaved (weight, input) pairs
+    prev = out._prev
+    data = prev[0].data
+    for i in range(1, len(prev), 2):
+        data += prev[i].data * prev[i + 1].data
+    out.data = data
+
+
+def _forward_relu(out):
+    a, = out._prev
+    out.data = a.data if a.data > 0 else 0.0
+
+
+def _forward_sigmoid(out):
+    a, = out._prev
+    out.data = _sigmoid(a.data)
+
+
+def _forward_tanh(out):
+    a, = out._prev
+    out.data = math.tanh(a.data)
+
+
+def _forward_leaky_relu(out):
+    a, = out._prev
+    out.data = out._c * a.data if a.data < 0 else a.data
+
+
+def _forward_elu(out):
+    a, = out._prev
+    out.data = out._c * (math.exp(a.data) - 1) if a.data < 0 else a.data
+
+
+def _forward_exp(out):
+    a, = out._prev
+    out.data = math.exp(a.data)
+
+
+# Forward function of every non-leaf Value operation, keyed by the _op tag of the output node.
+# Used to recompute a recorded graph after its leaves changed (see Value.compile_backward).
+_FORWARD = {
+    '+': _forward_add,
+    '*': _forward_mul,
+    '/': _forward_div,
+    '**': _forward_pow_const,
+    'Pow': _forward_pow,
+    'Affine': _forward_affine,
+    'ReLU': _forward_relu,
+    'Sigmoid': _forward_sigmoid,
+    'Tanh': _forward_tanh,
+    'LeakyReLU': _forward_leaky_relu,
+    'ELU': _forward_elu,
+    'Exp': _forward_exp,
+}
 
 
 class Value:
@@ -7,19 +278,39 @@ class Value:
     It is used to build a computational graph and perform backpropagation.
     """
 
-    def __init__(self, data, _children=(), _op=''):
+    # Values are created for every scalar operation, so skip the per-instance __dict__
+    __slots__ = ('data', 'grad', 'requires_grad', '_prev', '_op', '_c')
+
+    def __init__(self, data, _children=(), _op='', requires_grad=True):
         """
         Initialize a Value object.
         :param data: numerical value (scalar).
-        :param _children: set of parent nodes in the computational graph.
-        :param _op: string describing the operation that created this node.
+        :param _children: tuple of parent nodes in the computational graph.
+        :param _op: tag of the operation that created this node (a key of _BACKWARD).
+        :param requires_grad: whether backward should compute a gradient for this leaf.
+        Ignored for non-leaf nodes, which require a gradient whenever one of their parents does
+        at the time the node is created.
         """
 
         self.data = data
         self.grad = 0.0
-        self._backward = lambda: None
-        self._prev = set(_children)
-        self._op = _op
+        self.requires_grad = requires_grad
+        if _GRAD_ENABLED:
+            self._prev = _children
+            self._op = _op
+            if _children:
+                # Decided once here, so backward needs no separate reachability pass
+                self.requires_grad = False
+                for child in _children:
+                    if child.requires_grad:
+                        self.requires_grad = True
+                        break
+        else:
+            # A detached result, not a trainable leaf
+            self._prev = ()
+            self._op = ''
+            self.requires_grad = False
+        self._c = None  # Constant operand of the operation (exponent, alpha), if any
 
     def __add__(self, other):
         """
@@ -28,16 +319,9 @@ class Value:
         :return: a new Value object representing the result of addition.
         """
 
-        other = other if isinstance(other, Value) else Value(other)
-        out = Value(self.data + other.data, (self, other), '+')
+        other = other if isinstance(other, Value) else Value(other, requires_grad=False)
 
-        def _backward():
-            self.grad += out.grad
-            other.grad += out.grad
-
-        out._backward = _backward
-
-        return out
+        return Value(self.data + other.data, (self, other), '+')
 
     def __mul__(self, other):
         """
@@ -46,33 +330,20 @@ class Value:
         :return: a new Value object representing the result of multiplication.
         """
 
-        other = other if isinstance(other, Value) else Value(other)
-        out = Value(self.data * other.data, (self, other), '*')
-
-        def _backward():
-            self.grad += other.data * out.grad
-            other.grad += self.data * out.grad
+        other = other if isinstance(other, Value) else Value(other, requires_grad=False)
 
-        out._backward = _backward
-
-        return out
+        return Value(self.data * other.data, (self, other), '*')
 
     def __truediv__(self, other):
         """
         Overload the division operator (/).
-        :param other: second operand (a number object).
+        :param other: second operand (can be a number or a Value object).
         :return: a new Value object representing the result of division.
         """
 
-        out = self * other ** -1
-
-        def _backward():
-            self.grad += out.grad / other.data
-            other.grad -= out.grad * self.data / (other.data ** 2)
-
-        out._backward = _backward
+        other = other if isinstance(other, Value) else Value(other, requires_grad=False)
 
-        return out
+        return Value(self.data / other.data, (self, other), '/')
 
     def __pow__(self, other):
         """
@@ -85,21 +356,35 @@ class Value:
         :return: A new Value object containing the result of the operation.
         """
 
-        other = other if isinstance(other, Value) else Value(other)
-        out = Value(self.data ** other.data, (self, other), '**')
+        if not isinstance(other, Value):
+            # Constant exponent: no gradient w.r.t. the exponent is needed
+            out = Value(self.data ** other, (self,), '**')
+            out._c = other
 
-        def _backward():
-            a = self.data
-            b = other.data
-            grad_a = b * (a ** (b - 1)) if a != 0 else 0.0
-            grad_b = (a ** b) * math.log(a) if a > 0 else 0.0
+            return out
 
-            self.grad += grad_a * out.grad
-            other.grad += grad_b * out.grad
+        return Value(self.data ** other.data, (self, other), 'Pow')
 
-        out._backward = _backward
+    @classmethod
+    def affine(cls, weights, xs, bias):
+        """
+        Fused affine combination bias + sum(w * x), built as a single node of the graph
+        instead of one multiplication and one addition node per term.
+        :param weights: Value objects multiplying the inputs.
+        :param xs: inputs (numbers or Value objects), paired with weights as zip() does.
+        :param bias: Value object added to the sum.
+        :return: a new Value object representing the affine combination.
+        """
 
-        return out
+        data = bias.data
+        children = [bias]
+        for w, x in zip(weights, xs):
+            x = x if isinstance(x, Value) else Value(x, requires_grad=False)
+            data += w.data * x.data
+            children.append(w)
+            children.append(x)
+
+        return cls(data, tuple(children), 'Affine')
 
     def relu(self):
         """
@@ -107,117 +392,427 @@ class Value:
         :return: a new Value object representing the result of applying ReLU.
         """
 
-        out = Value(0 if self.data < 0 else self.data, (self,), 'ReLU')
+        return Value(self.data if self.data > 0 else 0.0, (self,), 'ReLU')
+
+    def sigmoid(self):
+        """
+        Sigmoid activation function.
+        :return: a new Value object representing the result of applying Sigmoid.
+        """
+
+        return Value(_sigmoid(self.data), (self,), 'Sigmoid')
+
+    def tanh(self):
+        """
+        Hyperbolic tangent (tanh) activation function.
+        :return: a new Value object representing the result of applying tanh.
+        """
+
+        return Value(math.tanh(self.data), (self,), 'Tanh')
+
+    def leaky_relu(self, alpha=0.01):
+        """
+        Leaky ReLU activation function.
+        :param alpha: slope coefficient for negative values.
+        :return: a new Value object representing the result of applying Leaky ReLU.
+        """
+
+        out = Value(alpha * self.data if self.data < 0 else self.data, (self,), 'LeakyReLU')
+        out._c = alpha
+
+        return out
+
+    def elu(self, alpha=1.0):
+        """
+        ELU (Exponential Linear Unit) activation function.
+        :param alpha: coefficient for the exponential part.
+        :return: a new Value object representing the result of applying ELU.
+        """
+
+        out = Value(
+            alpha * (math.exp(self.data) - 1) if self.data < 0 else self.data,
+            (self,), 'ELU'
+        )
+        out._c = alpha
+
+        return out
+
+    def exp(self):
+        """
+        Exponential function (e^x).
+        :return: a new Value object representing the result of raising e to the power of self.data.
+        """
+
+        return Value(math.exp(self.data), (self,), 'Exp')
+
+    def zero_grad(self):
+        """
+        Reset the gradient to zero.
+        """
+
+        self.grad = 0.0
+
+    def _backward_order(self, canonicalize=False):
+        """
+        Nodes whose backward step has to run, in the order backpropagation visits them.
+        :param canonicalize: merge identical subexpressions first (see build_topo).
+        :return: list of non-leaf nodes, every node placed before all of its parents.
+        """
+
+        topo = build_topo(self, canonicalize)
+
+        # Nodes that do not depend on any leaf requiring a gradient only feed gradients
+        # nobody reads, so their backward steps are skipped
+        return [v for v in reversed(topo) if v._prev and v.requires_grad]
+
+    def backward(self, canonicalize=False):
+        """
+        Perform backpropagation to compute gradients.
+        :param canonicalize: merge identical subexpressions before propagating (see build_topo).
+        """
+
+        order = self._backward_order(canonicalize)
+        self.grad = 1  # Gradient of the final node is 1
+        for v in order:
+            _BACKWARD[v._op](v)
+
+    def compile_backward(self, canonicalize=False):
+        """
+        Compile the forward and backward passes of this graph into a flat list of steps,
+        so a training loop can build the graph once and replay it after every update:
+
+            steps = loss.compile_backward()
+            for _ in range(epochs):
+                for step in steps:
+                    step()
+                for p in params:
+                    p.data -= lr * p.grad
+                    p.zero_grad()
+
+        The steps recompute the data of every non-leaf node from the current leaf data,
+        reset the non-leaf gradients, seed this node with 1 and backpropagate.
+        Leaf gradients accumulate as with backward(). Leaves must be updated in place
+        (by assigning their data) and the graph structure stays fixed, e.g. ReLU still
+        has the same node, only its value changes.
+        :param canonicalize: merge identical subexpressions first (see build_topo).
+        :return: tuple of functions taking no arguments.
+        """
+
+        nodes = [v for v in build_topo(self, canonicalize) if v._prev]
+        # Only nodes that depend on a leaf requiring a gradient need a backward step
+        order = [v for v in reversed(nodes) if v.requires_grad]
+
+        def reset():
+            for v in order:
+                v.grad = 0.0
+            self.grad = 1  # Gradient of the final node is 1
+
+        return (
+            tuple(partial(_FORWARD[v._op], v) for v in nodes)
+            + (reset,)
+            + tuple(partial(_BACKWARD[v._op], v) for v in order)
+        )
+
+    def __neg__(self):
+        """Overload unary negation (-self)."""
+
+        return self * -1
+
+    def __sub__(self, other):
+        """Overload subtraction operator (self - other)."""
+
+        return self + (-other)
+
+    def __radd__(self, other):
+        """Overload right addition (other + self)."""
+
+        return self + other
+
+    def __rmul__(self, other):
+        """Overload right multiplication (other * self)."""
+
+        return self * other
+
+    def __repr__(self):
+        """String representation of the object."""
+
+        return f"Value(data={self.data:.4f}, grad={self.grad:.4f})"
+
+
+def _unbroadcast(grad, shape):
+    """
+    Reduce a broadcasted gradient back to the shape of the operand it belongs to.
+    :param grad: gradient with the (broadcasted) shape of the result.
+    :param shape: shape of the original operand.
+    :return: gradient summed over the broadcasted axes.
+    """
+
+    while grad.ndim > len(shape):
+        grad = grad.sum(axis=0)
+    for axis, size in enumerate(shape):
+        if size == 1 and grad.shape[axis] != 1:
+            grad = grad.sum(axis=axis, keepdims=True)
+    return grad
+
+
+class Tensor:
+    """
+    The Tensor class mirrors Value, but wraps a NumPy array instead of a scalar.
+    A whole layer of scalar operations collapses into a single node of the computational graph.
+    """
+
+    def __init__(self, data, _children=(), _op=''):
+        """
+        Initialize a Tensor object.
+        :param data: array-like numerical data (converted to a float64 NumPy array).
+        :param _children: parent nodes in the computational graph.
+        :param _op: string describing the operation that created this node.
+        """
+
+        self.data = np.asarray(data, dtype=np.float64)
+        self._grad = None  # Allocated on first access, so no_grad results never allocate one
+        self._scratch = None  # Buffer shaped like grad, allocated on first use by backward
+        self._backward = lambda: None
+        self._prev = _children if _GRAD_ENABLED else ()
+        self._op = _op
+
+    @property
+    def grad(self):
+        """Gradient with the shape of data, allocated as zeros on first access."""
+
+        if self._grad is None:
+            self._grad = np.zeros_like(self.data)
+        return self._grad
+
+    @grad.setter
+    def grad(self, value):
+        self._grad = value
+
+    def _grad_scratch(self):
+        """
+        Scratch buffer with the shape of the gradient, reused by every backward pass.
+        :return: preallocated NumPy array (contents are undefined).
+        """
+
+        if self._scratch is None:
+            self._scratch = np.empty_like(self.data)
+        return self._scratch
+
+    @property
+    def shape(self):
+        """Shape of the underlying array."""
+
+        return self.data.shape
+
+    @property
+    def T(self):
+        """
+        Transpose of the tensor.
+        The result is a view: its data, gradient and scratch buffer alias the ones of self,
+        so gradients accumulate straight into self.grad and no backward step is needed.
+        :return: a new Tensor object holding the transposed data.
+        """
+
+        out = Tensor(self.data.T, (self,), 'T')
+        if _GRAD_ENABLED:
+            out.grad = self.grad.T
+            out._scratch = self._grad_scratch().T
+
+        return out
+
+    def __add__(self, other):
+        """
+        Overload the addition operator (+) with NumPy broadcasting.
+        :param other: second operand (can be an array-like or a Tensor object).
+        :return: a new Tensor object representing the result of addition.
+        """
+
+        other = other if isinstance(other, Tensor) else Tensor(other)
+        out = Tensor(self.data + other.data, (self, other), '+')
+        if not _GRAD_ENABLED:
+            return out
 
         def _backward():
-            self.grad += (out.data > 0) * out.grad
+            self.grad += _unbroadcast(out.grad, self.data.shape)
+            other.grad += _unbroadcast(out.grad, other.data.shape)
 
         out._backward = _backward
 
         return out
 
-    def sigmoid(self):
+    def __mul__(self, other):
         """
-        Sigmoid activation function.
-        :return: a new Value object representing the result of applying Sigmoid.
+        Overload the element-wise multiplication operator (*) with NumPy broadcasting.
+        :param other: second operand (can be an array-like or a Tensor object).
+        :return: a new Tensor object representing the result of multiplication.
         """
 
-        out = Value(1 / (1 + (-self).exp().data), (self,), 'Sigmoid')
+        other = other if isinstance(other, Tensor) else Tensor(other)
+        out = Tensor(self.data * other.data, (self, other), '*')
+        if not _GRAD_ENABLED:
+            return out
 
         def _backward():
-            self.grad += out.data * (1 - out.data) * out.grad
+            self.grad += _unbroadcast(other.data * out.grad, self.data.shape)
+            other.grad += _unbroadcast(self.data * out.grad, other.data.shape)
 
         out._backward = _backward
 
         return out
 
-    def tanh(self):
+    def __pow__(self, other):
         """
-        Hyperbolic tangent (tanh) activation function.
-        :return: a new Value object representing the result of applying tanh.
+        Overload the element-wise exponentiation operator (**).
+        :param other: the exponent (a number).
+        :return: a new Tensor object containing the result of the operation.
         """
 
-        out = Value((2 / (1 + (-2 * self).exp().data)) - 1, (self,), 'Tanh')
+        out = Tensor(self.data ** other, (self,), f'**{other}')
+        if not _GRAD_ENABLED:
+            return out
 
         def _backward():
-            self.grad += (1 - out.data ** 2) * out.grad
+            self.grad += other * self.data ** (other - 1) * out.grad
 
         out._backward = _backward
 
         return out
 
-    def leaky_relu(self, alpha=0.01):
+    def __matmul__(self, other):
         """
-        Leaky ReLU activation function.
-        :param alpha: slope coefficient for negative values.
-        :return: a new Value object representing the result of applying Leaky ReLU.
+        Overload the matrix multiplication operator (@).
+        :param other: second operand, a 1-D vector or 2-D matrix (can be an array-like or a Tensor object).
+        :return: a new Tensor object representing the matrix product.
         """
 
-        out = Value(alpha * self.data if self.data < 0 else self.data, (self,), f'LeakyReLU({alpha})')
+        other = other if isinstance(other, Tensor) else Tensor(other)
+        if self.data.ndim not in (1, 2) or other.data.ndim not in (1, 2):
+            raise ValueError(
+                f"Tensor @ supports 1-D and 2-D operands, got shapes {self.data.shape} and {other.data.shape}"
+            )
+        out = Tensor(self.data @ other.data, (self, other), '@')
+        if not _GRAD_ENABLED:
+            return out
 
         def _backward():
-            self.grad += (alpha if self.data < 0 else 1) * out.grad
+            # A 1-D left operand acts as a row and a 1-D right operand as a column,
+            # so both adjoints are matrix products whatever the operand dimensions
+            a = self.data if self.data.ndim == 2 else self.data.reshape(1, -1)
+            b = other.data if other.data.ndim == 2 else other.data.reshape(-1, 1)
+            g = out.grad.reshape(a.shape[0], b.shape[1])
+            # Adjoints are computed into preallocated scratch buffers and added in place,
+            # so a backward pass allocates no temporary arrays for the products
+            np.matmul(g, b.T, out=self._grad_scratch().reshape(a.shape))
+            np.add(self.grad, self._scratch, out=self.grad)
+            np.matmul(a.T, g, out=other._grad_scratch().reshape(b.shape))
+            np.add(other.grad, other._scratch, out=other.grad)
 
         out._backward = _backward
 
         return out
 
-    def elu(self, alpha=1.0):
+    def linear(self, W, b, relu=False):
         """
-        ELU (Exponential Linear Unit) activation function.
-        :param alpha: coefficient for the exponential part.
-        :return: a new Value object representing the result of applying ELU.
+        Fused dense layer ReLU(self @ W.T + b) as a single node of the graph.
+        Instead of separate matmul, bias and ReLU nodes with their intermediate results,
+        backward only keeps the inputs and, with relu=True, a boolean mask of active outputs.
+        :param W: weight matrix Tensor of shape (output_size, input_size).
+        :param b: bias vector Tensor of shape (output_size,).
+        :param relu: whether to apply ReLU to the result.
+        :return: a new Tensor object holding the layer output.
         """
 
-        out = Value(
-            alpha * ((self).exp().data - 1) if self.data < 0 else self.data,
-            (self,), f'ELU({alpha})'
-        )
+        z = self.data @ W.data.T
+        z += b.data
+        mask = None
+        if relu:
+            if _GRAD_ENABLED:
+                mask = z > 0
+            np.maximum(z, 0, out=z)
+        out = Tensor(z, (self, W, b), 'LinearReLU' if relu else 'Linear')
+        if not _GRAD_ENABLED:
+            return out
 
         def _backward():
-            self.grad += (alpha * out.exp().data if self.data < 0 else 1) * out.grad
+            dz = out.grad * mask if relu else out.grad
+            np.matmul(dz, W.data, out=self._grad_scratch())
+            np.add(self.grad, self._scratch, out=self.grad)
+            if self.data.ndim == 1:
+                np.outer(dz, self.data, out=W._grad_scratch())
+            else:
+                np.matmul(dz.T, self.data, out=W._grad_scratch())
+            np.add(W.grad, W._scratch, out=W.grad)
+            b.grad += _unbroadcast(dz, b.data.shape)
 
         out._backward = _backward
 
         return out
 
-    def exp(self):
+    def relu(self):
         """
-        Exponential function (e^x).
-        :return: a new Value object representing the result of raising e to the power of self.data.
+        Element-wise ReLU (Rectified Linear Unit) activation function.
+        :return: a new Tensor object representing the result of applying ReLU.
         """
 
-        out = Value(math.exp(self.data), (self,), 'Exp')
+        out = Tensor(np.maximum(0, self.data), (self,), 'ReLU')
+        if not _GRAD_ENABLED:
+            return out
 
         def _backward():
-            self.grad += out.data * out.grad
+            self.grad += (out.data > 0) * out.grad
 
         out._backward = _backward
 
         return out
 
-    def backward(self):
+    def sum(self):
         """
-        Perform backpropagation to compute gradients.
+        Sum of all elements.
+        :return: a new scalar Tensor object holding the sum.
         """
 
-        topo = []
-        visited = set()
+        out = Tensor(self.data.sum(), (self,), 'Sum')
+        if not _GRAD_ENABLED:
+            return out
+
+        def _backward():
+            self.grad += out.grad
 
-        def build_topo(v):
-            """
-            Build the topological order of nodes in the computational graph.
-            Topological sorting ensures that parent nodes are processed before their children.
-            :param v: current node in the graph.
-            """
-            if v not in visited:
-                visited.add(v)
-                for child in v._prev:
-                    build_topo(child)
-                topo.append(v)
+        out._backward = _backward
 
-        build_topo(self)
-        self.grad = 1  # Gradient of the final node is 1
+        return out
+
+    def mean(self):
+        """
+        Mean of all elements, e.g. to average a loss over a batch.
+        :return: a new scalar Tensor object holding the mean.
+        """
+
+        out = Tensor(self.data.mean(), (self,), 'Mean')
+        if not _GRAD_ENABLED:
+            return out
+
+        def _backward():
+            self.grad += out.grad / self.data.size
+
+        out._backward = _backward
+
+        return out
+
+    def zero_grad(self):
+        """
+        Reset the gradient to zero in place, keeping the preallocated gradient buffer.
+        """
+
+        self.grad.fill(0.0)
+
+    def backward(self):
+        """
+        Perform backpropagation to compute gradients.
+        """
+
+        topo = build_topo(self)
+        self.grad.fill(1.0)  # Gradient of the final node is 1 for every element
         for v in reversed(topo):
             v._backward()
 
@@ -244,4 +839,4 @@ class Value:
     def __repr__(self):
         """String representation of the object."""
 
-        return f"Value(data={self.data:.4f}, grad={self.grad:.4f})"
+        return f"Tensor(data={np.array2string(self.data, precision=4)}, grad={np.array2string(self.grad, precision=4)})"
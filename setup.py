@@ -0,0 +1,17 @@
+"""
+Optional build of TinyGrad.py as a C extension with Cython:
+
+    python setup.py build_ext --inplace
+
+TinyGrad.pxd declares Value as an extension type. The compiled module takes
+precedence over TinyGrad.py on import, so `from TinyGrad import Value` stays unchanged.
+Delete the built TinyGrad.*.so to go back to the pure Python module.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='TinyGrad',
+    ext_modules=cythonize(['TinyGrad.py'], language_level=3),
+)